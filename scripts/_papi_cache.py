@@ -0,0 +1,215 @@
+"""
+_papi_cache.py
+
+Shared log parsing for the plotting scripts.
+Results are cached as Parquet under [results-dir]/.cache: the merged runs + counters frame,
+guarded by a signature of runs.csv and the log mtimes, and the PAPITO counters of each log,
+keyed by log path and mtime, so a changed log set only re-parses the logs that changed.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # plain pandas CSV reader and no Parquet caches
+    pa = pacsv = None
+
+CACHE_DIR = ".cache"
+CACHE_NAME = "papi_cache.parquet"
+FRAME_NAME = "parsed.parquet"
+# Bump when a change to parse_papito_from_log alters the counters it returns
+PARSER_VERSION = 1
+# Bump when a change to _read_runs or the frame built by load_or_parse alters parsed.parquet
+PARSE_CACHE_VERSION = 1
+# Below this many logs, starting worker processes costs more than the parsing itself
+PARALLEL_MIN_LOGS = 8
+MISSING_LOG_WARNING = "Warning: log file not found at {}"
+
+# runs.csv columns used by the plots; elapsed_s and energy_J are coerced to numbers later,
+# since failed runs can leave non-numeric text in them
+RUNS_COLUMNS = ["mode", "N", "BS", "tuning", "elapsed_s", "logfile", "energy_J"]
+RUNS_TYPES = {"mode": "string", "N": "int32", "BS": "int32", "tuning": "string", "logfile": "string"}
+
+
+def _last_line_tokens(mm: mmap.mmap, marker: bytes):
+    """Returns the fields after `marker` on the last line starting with it, or None."""
+    pos = mm.rfind(marker)
+    while pos >= 0:
+        start = pos + len(marker)
+        if (pos == 0 or mm[pos - 1] == ord("\n")) and mm[start : start + 1] in (b"\t", b" "):
+            end = mm.find(b"\n", start)
+            return mm[start : end if end >= 0 else len(mm)].decode(errors="ignore").split()
+        pos = mm.rfind(marker, 0, pos)
+    return None
+
+
+def parse_papito_from_log(logpath: Path):
+    """Extracts the PAPI counters and values from a log file."""
+    try:
+        with logpath.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            counters = _last_line_tokens(mm, b"PAPITO_COUNTERS")
+            raw_values = _last_line_tokens(mm, b"PAPITO_VALUES")
+    except (FileNotFoundError, ValueError):
+        # Missing logs are reported by load_or_parse; mmap refuses empty files
+        return None
+
+    if counters and raw_values and len(counters) == len(raw_values):
+        # One vectorized coercion for the whole line instead of one call per token
+        values = pd.to_numeric(np.array(raw_values), errors="coerce")
+        return dict(zip(counters, values.tolist()))
+    return None
+
+
+def _file_mtimes(results_dir: Path):
+    """Name -> st_mtime_ns of every file in the results directory, from one directory scan."""
+    with os.scandir(results_dir) as entries:
+        return {e.name: e.stat().st_mtime_ns for e in entries if e.is_file()}
+
+
+def _read_runs(runs_csv_path: Path):
+    """Reads only RUNS_COLUMNS from runs.csv, with fixed types for the key columns."""
+    if pacsv is None:
+        df = pd.read_csv(
+            runs_csv_path, usecols=lambda c: c in RUNS_COLUMNS, dtype=RUNS_TYPES,
+            keep_default_na=False, na_values={"elapsed_s": ["", "NA"], "energy_J": ["", "NA"]},
+        )
+        return df.reindex(columns=RUNS_COLUMNS)
+
+    options = pacsv.ConvertOptions(
+        include_columns=RUNS_COLUMNS,
+        include_missing_columns=True,
+        column_types={c: getattr(pa, t)() for c, t in RUNS_TYPES.items()},
+    )
+    # Arrow-backed columns avoid object-dtype strings
+    return pacsv.read_csv(runs_csv_path, convert_options=options).to_pandas(
+        types_mapper=pd.ArrowDtype
+    )
+
+
+def _read_cache(cache_path: Path):
+    """Cached counters per log, or an empty cache if unreadable or from another PARSER_VERSION."""
+    try:
+        cached = pd.read_parquet(cache_path, engine="pyarrow")
+        if cached.attrs.get("parser_version") == PARSER_VERSION:
+            return cached
+    except (OSError, ValueError, ImportError):
+        pass
+    return pd.DataFrame(columns=["mtime_ns"], index=pd.Index([], name="logpath"))
+
+
+def _signature(runs_csv_path: Path, mtimes: dict):
+    """Hash of runs.csv, of the name and mtime of every log and of how runs.csv is read."""
+    versions = [PARSE_CACHE_VERSION, PARSER_VERSION, RUNS_COLUMNS, RUNS_TYPES]
+    h = hashlib.blake2b(json.dumps(versions).encode())
+    h.update(runs_csv_path.read_bytes())
+    for name in sorted(n for n in mtimes if n.endswith(".log")):
+        h.update(f"{name}:{mtimes[name]}\n".encode())
+    return h.hexdigest()
+
+
+def _warn_missing_logs(results_dir: Path, logfiles, mtimes: dict, message: str):
+    """Prints `message` for every run whose log is not in the results directory."""
+    for logfile in logfiles:
+        name = Path(logfile).name
+        if name not in mtimes:
+            print(message.format(results_dir / name))
+
+
+def load_or_parse(results_dir: Path, missing_log_warning: str = MISSING_LOG_WARNING):
+    """
+    Builds a DataFrame from runs.csv joined with the PAPI counters of each run.
+    Only logs missing from the cache or modified since they were cached are parsed.
+    Runs without a log are reported with `missing_log_warning` on every call, cached or not.
+    The input signature is kept in `df.attrs["signature"]` for caches built on top of it.
+    """
+    runs_csv_path = results_dir / "runs.csv"
+    if not runs_csv_path.exists():
+        raise FileNotFoundError(
+            f"'{runs_csv_path}' not found. Please run experiments first."
+        )
+
+    cache_dir = results_dir / CACHE_DIR
+    frame_path = cache_dir / FRAME_NAME
+    sig_path = frame_path.with_suffix(".sig")
+    mtimes = _file_mtimes(results_dir)
+    sig = _signature(runs_csv_path, mtimes)
+    try:
+        if sig_path.read_text() == sig:
+            cached_frame = pd.read_parquet(frame_path, engine="pyarrow")
+            logfiles = cached_frame["logfile"].to_numpy()
+            _warn_missing_logs(results_dir, logfiles, mtimes, missing_log_warning)
+            cached_frame.attrs["signature"] = sig
+            return cached_frame
+    except (OSError, ValueError, ImportError):
+        pass
+    # The caches are best-effort: a read-only results directory is still plotted, just uncached
+    try:
+        cache_dir.mkdir(exist_ok=True)
+    except OSError:
+        pass
+
+    # mode stays a plain string column: seaborn mis-assigns hue colours when a categorical
+    # hue is combined with style=
+    df = _read_runs(runs_csv_path)
+    df["tuning"] = df["tuning"].astype("category")
+    df["elapsed_s"] = pd.to_numeric(df["elapsed_s"], errors="coerce")
+
+    _warn_missing_logs(results_dir, df["logfile"].to_numpy(), mtimes, missing_log_warning)
+    # Logs missing from the directory get mtime -1, like an absent file always had
+    lognames = [Path(lf).name for lf in df["logfile"].to_numpy()]
+    logpaths = [str(results_dir / name) for name in lognames]
+    current = pd.Series(
+        {p: mtimes.get(name, -1) for p, name in zip(logpaths, lognames)}, dtype="int64"
+    )
+
+    cache_path = cache_dir / CACHE_NAME
+    cached = _read_cache(cache_path)
+    up_to_date = cached["mtime_ns"].to_numpy() == current.reindex(cached.index).to_numpy()
+    papi_cache = cached[up_to_date]
+
+    stale = current.index[~current.index.isin(papi_cache.index)]
+    if len(stale) or len(papi_cache) != len(cached):
+        if len(stale) < PARALLEL_MIN_LOGS:
+            papi_data = [parse_papito_from_log(Path(p)) for p in stale]
+        else:
+            with ProcessPoolExecutor() as ex:
+                papi_data = list(ex.map(parse_papito_from_log, map(Path, stale), chunksize=16))
+        # One preallocated array per counter instead of letting pandas align a list of dicts
+        counters = dict.fromkeys(k for d in papi_data if d for k in d)
+        columns = {c: np.full(len(papi_data), np.nan) for c in counters}
+        for i, d in enumerate(papi_data):
+            if d:
+                for counter, value in d.items():
+                    columns[counter][i] = value
+        parsed = pd.DataFrame(columns, index=pd.Index(stale, name="logpath"))
+        parsed.insert(0, "mtime_ns", current[stale].to_numpy())
+        papi_cache = pd.concat([papi_cache, parsed]) if len(papi_cache) else parsed
+        # Stored in the Parquet metadata, so counters from an older parser are re-parsed
+        papi_cache.attrs["parser_version"] = PARSER_VERSION
+        if pa is not None:
+            try:
+                papi_cache.to_parquet(cache_path, engine="pyarrow", compression="zstd")
+            except OSError:
+                pass
+
+    # Counter columns are attached as plain arrays: no index alignment against df
+    papi_df = papi_cache.reindex(logpaths).drop(columns="mtime_ns")
+    merged = df.assign(**{c: papi_df[c].to_numpy() for c in papi_df.columns})
+    merged.attrs["signature"] = sig
+    if pa is not None:
+        try:
+            # Drop the old signature first: a failed write must not leave it guarding other data
+            sig_path.unlink(missing_ok=True)
+            merged.to_parquet(frame_path, engine="pyarrow", compression="zstd")
+            sig_path.write_text(sig)
+        except OSError:
+            pass
+    return merged
@@ -0,0 +1,801 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#   "pandas",
+#   "numpy",
+#   "matplotlib",
+#   "seaborn",
+#   "pyarrow",
+# ]
+# ///
+
+"""
+plotting.py
+
+Shared metric and plotting code behind plot_comparison.py, plot_detailed_comparison.py
+and plot_results.py. Each of those scripts calls main() with its plot style; running this
+file directly renders all three styles from a single load of the results.
+"""
+
+import argparse
+import hashlib
+import inspect
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")  # plots are only written to files; skip GUI backend probing
+import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
+import seaborn as sns
+from pathlib import Path
+
+from _papi_cache import CACHE_DIR, MISSING_LOG_WARNING, load_or_parse
+
+sns.set_theme(style="whitegrid", font_scale=1.2)
+# zlib level 1: slightly larger PNGs, noticeably faster to encode
+PNG_KWARGS = {"compress_level": 1}
+
+# Encoded PNGs are written to disk by background threads while the next plot is drawn
+_png_writer = ThreadPoolExecutor(max_workers=4)
+_pending_writes = []
+
+METRICS_NAME = "metrics.parquet"
+# Bump when a change outside load_runs/safe_div/calculate_metrics alters the metrics frame
+METRICS_CACHE_VERSION = 1
+
+# Columns read by calculate_metrics and the plots; everything else is dropped after loading
+NEEDED_COLUMNS = [
+    "mode", "N", "BS", "tuning", "elapsed_s", "energy_J",
+    "PAPI_TOT_INS", "PAPI_TOT_CYC", "PAPI_FP_OPS", "PAPI_VEC_INS", "PAPI_FP_INS",
+    "PAPI_L1_DCA", "PAPI_L1_DCM", "PAPI_L2_DCH", "PAPI_L2_DCM",
+]
+
+
+def load_runs(results_dir: Path, missing_log_warning: str = MISSING_LOG_WARNING):
+    """Loads runs.csv with its PAPI counters, keeping only the columns the plots use."""
+    df = load_or_parse(results_dir, missing_log_warning)
+    df = df[[c for c in NEEDED_COLUMNS if c in df.columns]]
+    # float32 is plenty for plotting and halves the bytes every groupby has to move
+    measures = [c for c in df.columns if c.startswith("PAPI_") or c in ("elapsed_s", "energy_J")]
+    return df.assign(**{
+        c: pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=np.float32, na_value=np.nan)
+        for c in measures
+    })
+
+
+def safe_div(num: np.ndarray, den: np.ndarray):
+    """num / den in one pass; 0 where the numerator is missing or the denominator is not positive."""
+    out = np.zeros_like(num, dtype=np.float64)
+    np.divide(num, den, out=out, where=np.isfinite(num) & (den > 0))
+    return out
+
+
+def calculate_metrics(df: pd.DataFrame, rename_map: dict | None = None):
+    """Computes derived metrics such as IPC, cache hit rates and instruction percentages."""
+    # Every derived column is built here and attached with a single assign
+    metrics = {"mode_orig": df["mode"]}
+
+    if rename_map:
+        metrics["mode"] = df["mode"].replace(rename_map)
+
+    mode = metrics.get("mode", df["mode"])
+    tuning = df["tuning"]
+    has_tuning = tuning.notna() & (tuning != "NA")
+    metrics["display_mode"] = mode.where(~has_tuning, mode + " (" + tuning.astype(str) + ")")
+
+    # Each counter is coerced to a float array once and shared by every ratio below
+    cols = {
+        c: pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=np.float64)
+        for c in (
+            "PAPI_TOT_INS", "PAPI_TOT_CYC", "PAPI_L1_DCA", "PAPI_L1_DCM",
+            "PAPI_L2_DCH", "PAPI_L2_DCM", "PAPI_VEC_INS", "PAPI_FP_INS",
+        )
+        if c in df.columns
+    }
+
+    if "PAPI_TOT_INS" in cols and "PAPI_TOT_CYC" in cols:
+        metrics["IPC"] = safe_div(cols["PAPI_TOT_INS"], cols["PAPI_TOT_CYC"])
+    else:
+        print("Warning: 'PAPI_TOT_INS' or 'PAPI_TOT_CYC' not found. Cannot calculate IPC.")
+        metrics["IPC"] = np.nan
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if "PAPI_L1_DCA" in cols and "PAPI_L1_DCM" in cols:
+            l1_accesses = cols["PAPI_L1_DCA"]
+            l1_hits = l1_accesses - cols["PAPI_L1_DCM"]
+            metrics["L1_HIT_RATE"] = np.where(l1_accesses == 0, 1.0, l1_hits / l1_accesses) * 100
+        else:
+            metrics["L1_HIT_RATE"] = np.nan
+
+        if "PAPI_L2_DCH" in cols and "PAPI_L2_DCM" in cols:
+            l2_hits = cols["PAPI_L2_DCH"]
+            l2_accesses = l2_hits + cols["PAPI_L2_DCM"]
+            metrics["L2_HIT_RATE"] = np.where(l2_accesses == 0, 1.0, l2_hits / l2_accesses) * 100
+        else:
+            metrics["L2_HIT_RATE"] = np.nan
+
+    if "PAPI_VEC_INS" in cols and "PAPI_TOT_INS" in cols:
+        metrics["VEC_INS_PERCENT"] = safe_div(cols["PAPI_VEC_INS"], cols["PAPI_TOT_INS"]) * 100
+    else:
+        metrics["VEC_INS_PERCENT"] = np.nan
+
+    if "PAPI_FP_INS" in cols and "PAPI_VEC_INS" in cols:
+        metrics["VECTORIZED_FP_PERCENT"] = safe_div(cols["PAPI_VEC_INS"], cols["PAPI_FP_INS"]) * 100
+    else:
+        metrics["VECTORIZED_FP_PERCENT"] = np.nan
+
+    # mode_orig is only used to filter rows, so it can be categorical. mode and display_mode
+    # stay strings: seaborn draws a categorical hue in the wrong colour once rows are missing
+    metrics["mode_orig"] = metrics["mode_orig"].astype("category")
+    return df.assign(**metrics)
+
+
+def load_metrics(
+    results_dir: Path, rename_map: dict | None = None, missing_log_warning: str = MISSING_LOG_WARNING
+):
+    """
+    load_runs followed by calculate_metrics, memoized in [results-dir]/.cache/metrics.parquet.
+    The cache is keyed by the input signature of load_or_parse, the rename map, the loaded
+    columns and dtypes, METRICS_CACHE_VERSION and the source of the functions that build the
+    frame, so changing any of them recomputes the metrics.
+    """
+    df = load_runs(results_dir, missing_log_warning)
+    signature = df.attrs.get("signature")
+    if signature is None:
+        return calculate_metrics(df, rename_map)
+
+    try:
+        h = hashlib.blake2b(json.dumps([
+            METRICS_CACHE_VERSION,
+            signature,
+            rename_map or {},
+            NEEDED_COLUMNS,
+            [[c, str(t)] for c, t in df.dtypes.items()],
+        ], sort_keys=True).encode())
+        for func in (load_runs, safe_div, calculate_metrics):
+            h.update(inspect.getsource(func).encode())
+        key = h.hexdigest()
+    except (OSError, TypeError):
+        # Without the source there is no reliable key, so the metrics are just not cached
+        return calculate_metrics(df, rename_map)
+    metrics_path = results_dir / CACHE_DIR / METRICS_NAME
+    key_path = metrics_path.with_suffix(".sig")
+    try:
+        if key_path.read_text() == key:
+            return pd.read_parquet(metrics_path, engine="pyarrow")
+    except (OSError, ValueError, ImportError):
+        pass
+
+    df_analyzed = calculate_metrics(df, rename_map)
+    try:
+        # Drop the old key first: a failed write must not leave it guarding other data
+        key_path.unlink(missing_ok=True)
+        df_analyzed.to_parquet(metrics_path, engine="pyarrow", compression="zstd")
+        key_path.write_text(key)
+    except (OSError, ValueError, ImportError):
+        pass
+    return df_analyzed
+
+
+def group_by_config(df: pd.DataFrame, keys: list):
+    """Averages repeated runs per configuration; the result is shared by every plot of a style."""
+    if df.empty:
+        return df
+    return df.groupby(keys).mean(numeric_only=True).reset_index()
+
+
+def save_png(fig: plt.Figure, out_path: Path):
+    """Renders `fig` to PNG in memory and queues the file write on the writer threads."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=150, pil_kwargs=PNG_KWARGS)
+    _pending_writes.append(_png_writer.submit(out_path.write_bytes, buf.getvalue()))
+
+
+def wait_for_png_writes():
+    """Blocks until every queued PNG is on disk; re-raises the first failed write."""
+    while _pending_writes:
+        _pending_writes.pop(0).result()
+
+
+def line_markers(n: int):
+    """
+    The n filled markers seaborn assigns to n style levels, in the same order: nine
+    hand-picked shapes, then regular polygons of increasing order (as seaborn's unique_markers).
+    """
+    markers = ["o", "X", (4, 0, 45), "P", (4, 0, 0), (4, 1, 0), "^", (4, 1, 45), "v"]
+    s = 5
+    while len(markers) < n:
+        a = 360 / (s + 1) / 2
+        markers.extend([(s + 1, 1, a), (s + 1, 0, a), (s, 1, 0), (s, 0, 0)])
+        s += 1
+    return markers[:n]
+
+
+def level_orders(grouped: pd.DataFrame, hue: str, style: str):
+    """
+    hue_order/style_order for sns.lineplot, computed once per frame instead of on every call.
+    Matches seaborn's own inference: first-seen order for labels, sorted for numbers.
+    """
+    orders = {}
+    for key, col in (("hue_order", hue), ("style_order", style)):
+        levels = grouped[col].dropna().unique()
+        orders[key] = sorted(levels) if pd.api.types.is_numeric_dtype(grouped[col]) else list(levels)
+    return orders
+
+
+# --- Shared Plots ---
+
+
+def plot_ipc_comparison(grouped: pd.DataFrame, out_path: Path, hue: str, legend_title: str):
+    if grouped.empty or "IPC" not in grouped.columns or grouped["IPC"].isnull().all():
+        print("IPC data is not available or data is empty, skipping IPC plot.")
+        return
+
+    fig = plt.figure(figsize=(14, 8))
+
+    ax = sns.lineplot(
+        data=grouped,
+        x="N",
+        y="IPC",
+        hue=hue,
+        style="BS",
+        **level_orders(grouped, hue, "BS"),
+        markers=True,
+        dashes=True,
+        legend="full",
+        palette="bright",
+        linewidth=2.5,
+        markersize=8,
+    )
+
+    ax.set_title("Instructions Per Cycle (IPC) Comparison", fontsize=20, weight="bold")
+    ax.set_ylabel("IPC", fontsize=14)
+    ax.set_xlabel("Matrix Size (N)", fontsize=14)
+    ax.legend(title=legend_title, fontsize=12)
+    ax.set_xscale("log", base=2)
+    ax.grid(True, which="both", ls="--")
+
+    plt.tight_layout()
+    print(f"Saving IPC comparison plot to {out_path}")
+    save_png(fig, out_path)
+    plt.close()
+
+
+# --- "individual" style (plot_comparison.py) ---
+
+
+def plot_individual_metrics(grouped: pd.DataFrame, plot_dir: Path):
+    if grouped.empty:
+        print("No data to plot after filtering.")
+        return
+
+    metrics_to_plot = {
+        "elapsed_s": "Execution Time (s)",
+        "PAPI_TOT_CYC": "Total Cycles",
+        "PAPI_FP_OPS": "Floating Point Operations",
+        "PAPI_VEC_INS": "Vector Instructions",
+    }
+
+    orders = level_orders(grouped, "display_mode", "BS")
+    fig, ax = plt.subplots(figsize=(14, 8))
+
+    for metric, title in metrics_to_plot.items():
+        if metric not in grouped.columns or grouped[metric].isnull().all():
+            print(
+                f"Warning: Metric '{metric}' has no valid data after aggregation. Skipping plot."
+            )
+            continue
+
+        ax.clear()
+        sns.lineplot(
+            data=grouped,
+            x="N",
+            y=metric,
+            hue="display_mode",
+            style="BS",
+            **orders,
+            markers=True,
+            dashes=True,
+            legend="full",
+            palette="bright",
+            linewidth=2.5,
+            markersize=8,
+            ax=ax,
+        )
+
+        ax.set_title(f"Performance Comparison: {title}", fontsize=20, weight="bold")
+        ax.set_ylabel(title, fontsize=14)
+        ax.set_xlabel("Matrix Size (N)", fontsize=14)
+        ax.legend(title="Algorithm (Tuning) | Block Size", fontsize=12)
+        ax.set_xscale("log", base=2)
+        ax.grid(True, which="both", ls="--")
+
+        out_path = plot_dir / f"comparison_{metric}.png"
+        fig.tight_layout()
+        print(f"Saving plot to {out_path}")
+        save_png(fig, out_path)
+
+    plt.close(fig)
+
+
+def render_individual(df: pd.DataFrame, plot_dir: Path):
+    grouped = group_by_config(df, ["display_mode", "N", "BS"])
+    plot_individual_metrics(grouped, plot_dir)
+    plot_ipc_comparison(
+        grouped, plot_dir / "comparison_ipc.png", "display_mode", "Algorithm (Tuning) | Block Size"
+    )
+
+
+# --- "grid" style (plot_detailed_comparison.py) ---
+
+
+def plot_performance_grid(grouped: pd.DataFrame, out_path: Path):
+    """
+    Creates a large, readable 2x2 grid of plots for key performance metrics.
+    """
+    metrics_to_plot = {
+        "elapsed_s": "Execution Time (s)",
+        "PAPI_TOT_CYC": "Total Cycles",
+        "PAPI_FP_OPS": "Floating Point Operations",
+        "PAPI_VEC_INS": "Vector Instructions",
+    }
+
+    available_metrics = {m: label for m, label in metrics_to_plot.items() if m in grouped.columns}
+    if len(available_metrics) < 1:
+        print("Not enough performance metrics available to generate the main plot.")
+        return
+
+    fig, axes = plt.subplots(2, 2, figsize=(20, 14))
+    fig.suptitle("Performance Comparison of Matrix Multiplication Kernels", fontsize=24, weight="bold")
+
+    axes_flat = axes.flatten()
+    orders = level_orders(grouped, "mode", "BS")
+
+    for i, (metric, ylabel) in enumerate(available_metrics.items()):
+        ax = axes_flat[i]
+        sns.lineplot(
+            data=grouped, x="N", y=metric, hue="mode", style="BS", **orders,
+            markers=True, dashes=True, ax=ax, legend="full",
+            palette="bright", linewidth=2.5, markersize=8
+        )
+        ax.set_title(ylabel, fontsize=16, weight="bold")
+        ax.set_ylabel(ylabel, fontsize=14)
+        ax.set_xlabel("Matrix Size (N)", fontsize=14)
+        ax.legend(title="Algorithm | Block Size", fontsize=12)
+        ax.set_xscale("log", base=2)
+        ax.grid(True, which="both", ls="--")
+
+    for i in range(len(available_metrics), len(axes_flat)):
+        axes_flat[i].set_visible(False)
+
+    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+    print(f"Saving enhanced performance grid plot to {out_path}")
+    save_png(fig, out_path)
+    plt.close()
+
+
+def render_grid(df: pd.DataFrame, plot_dir: Path):
+    grouped = group_by_config(df, ["mode", "N", "BS"])
+    plot_performance_grid(grouped, plot_dir / "performance_comparison.png")
+    plot_ipc_comparison(grouped, plot_dir / "ipc_comparison.png", "mode", "Algorithm | Block Size")
+
+
+# --- "bybs" style (plot_results.py) ---
+
+
+def plot_by_bs_and_metric(df: pd.DataFrame, plot_dir: Path):
+    """
+    Gera um gráfico separado para cada métrica e tamanho de bloco.
+    """
+    if df.empty:
+        print("Nenhum dado disponível para plotar após a filtragem.")
+        return
+
+    metrics_to_plot = {
+        "elapsed_s": "Tempo de Execução (s)",
+        "IPC": "Instruções por Ciclo (IPC)",
+        "PAPI_TOT_CYC": "Total de Ciclos",
+        "energy_J": "Consumo de Energia (Joules)",
+        "L1_HIT_RATE": "Taxa de Acerto do Cache L1 (%)",
+        "L2_HIT_RATE": "Taxa de Acerto do Cache L2 (%)",
+        "VEC_INS_PERCENT": "Percentual de Instruções Vetoriais (%)",
+        "VECTORIZED_FP_PERCENT": "Percentual de FP Vetorizado (%)",
+    }
+
+    baseline_df = df[df["mode_orig"] == "blas_whole"].copy()
+    if baseline_df.empty:
+        print("Aviso: Dados 'blas_whole' não encontrados. Não será possível adicionar como linha de base.")
+
+    block_sizes = sorted(df[df["BS"] > 0]["BS"].unique())
+    if not block_sizes:
+        print("Nenhum modo com blocos para plotar.")
+        return
+
+    # As médias são calculadas uma única vez; cada BS só seleciona suas linhas
+    group_keys = ["mode", "display_mode", "N"]
+    block_grouped = (
+        df[df["BS"] > 0].groupby(group_keys + ["BS"]).mean(numeric_only=True).reset_index()
+    )
+    baseline_grouped = baseline_df.groupby(group_keys).mean(numeric_only=True).reset_index()
+
+    # Cada gráfico desenha uma série por (estratégia, configuração). As séries da linha de
+    # base são separadas uma única vez e reaproveitadas em todos os BS, sem concat por BS
+    series_keys = ["mode", "display_mode"]
+    baseline_series = dict(list(baseline_grouped.groupby(series_keys, sort=False)))
+    block_series = {
+        bs: dict(list(sub.groupby(series_keys, sort=False)))
+        for bs, sub in block_grouped.groupby("BS")
+    }
+
+    # Valores válidos por (BS, métrica), contados nos dados brutos: pares sem dados são
+    # descartados antes de montar o quadro do BS ou abrir qualquer gráfico
+    metrics = [m for m in metrics_to_plot if m in df.columns]
+    valid_by_bs_metric = (
+        df[df["BS"] > 0].groupby("BS")[metrics].count() + baseline_df[metrics].count()
+    )
+
+    fig, ax = plt.subplots(figsize=(14, 8))
+
+    for bs in block_sizes:
+        valid = valid_by_bs_metric.loc[bs]
+        if not (valid > 0).any():
+            continue
+
+        bs_series = {**baseline_series, **block_series.get(bs, {})}
+        if not bs_series:
+            continue
+
+        # Os dados já são médias: as linhas são desenhadas direto com ax.plot, com cor por
+        # estratégia e marcador por configuração definidos uma vez por BS, como o seaborn faria
+        keys = sorted(bs_series)
+        strategies = list(dict.fromkeys(strategy for strategy, _ in keys))
+        configs = list(dict.fromkeys(config for _, config in keys))
+        colors = dict(zip(strategies, sns.color_palette("bright", len(strategies))))
+        markers = dict(zip(configs, line_markers(len(configs))))
+        legend_handles = (
+            [Line2D([], [], linestyle="", label="Estratégia")]
+            + [Line2D([], [], color=colors[s], linewidth=2.5, label=s) for s in strategies]
+            + [Line2D([], [], linestyle="", label="Configuração")]
+            + [
+                Line2D([], [], color=".2", linewidth=2.5, marker=markers[c], markersize=10,
+                       markeredgecolor="w", markeredgewidth=0.75, label=c)
+                for c in configs
+            ]
+        )
+        series = [
+            (colors[strategy], markers[config], bs_series[strategy, config])
+            for strategy, config in keys
+        ]
+
+        for metric in metrics:
+            if valid[metric] == 0:
+                continue
+
+            title = metrics_to_plot[metric]
+            ax.clear()
+            for color, marker, sub in series:
+                points = sub[sub[metric].notna()]
+                ax.plot(
+                    points["N"].to_numpy(),
+                    points[metric].to_numpy(),
+                    color=color,
+                    marker=marker,
+                    linewidth=2.5,
+                    markersize=10,
+                    markeredgecolor="w",
+                    markeredgewidth=0.75,
+                )
+            ax.legend(handles=legend_handles)
+
+            ax.set_title(f"{title} vs. Tamanho da Matriz (N) para Bloco={bs}", fontsize=20, weight="bold")
+            ax.set_ylabel(title, fontsize=14)
+            ax.set_xlabel("Tamanho da Matriz (N)", fontsize=14)
+            ax.set_xscale("log", base=2)
+            ax.grid(True, which="both", ls="--")
+
+            out_path = plot_dir / f"BS{bs}_{metric}.png"
+            fig.tight_layout()
+            print(f"Salvando gráfico em {out_path}")
+            save_png(fig, out_path)
+
+    plt.close(fig)
+
+
+def plot_best_vs_whole(df: pd.DataFrame, plot_dir: Path):
+    """
+    Compara as estratégias 'whole' contra a melhor e a pior estratégia em blocos.
+    """
+    whole_modes_df = df[df["mode_orig"].str.contains("_whole", na=False)]
+    block_modes_df = df[~df["mode_orig"].str.contains("_whole", na=False)]
+
+    if block_modes_df.empty:
+        print("Nenhum modo em blocos encontrado para a comparação 'melhor/pior vs. whole'.")
+        return
+
+    # --- MUDANÇA: Encontra o melhor E o pior caso ---
+    # Um único agrupamento (sem ordenação) serve às duas reduções
+    elapsed_by_n = block_modes_df.groupby("N", sort=False)["elapsed_s"]
+    best_block_idx = elapsed_by_n.idxmin().to_numpy()
+    worst_block_idx = elapsed_by_n.idxmax().to_numpy()
+
+    best_block_runs = block_modes_df.loc[best_block_idx].copy()
+    worst_block_runs = block_modes_df.loc[worst_block_idx].copy()
+
+    best_block_runs["display_mode"] = "Melhor Estratégia em Bloco"
+    worst_block_runs["display_mode"] = "Pior Estratégia em Bloco"
+
+    # Combina todos os dados para o gráfico
+    comparison_df = pd.concat([whole_modes_df, best_block_runs, worst_block_runs], ignore_index=True)
+
+    metrics_to_plot = {
+        "IPC": "Instruções por Ciclo (IPC)",
+        "PAPI_TOT_CYC": "Total de Ciclos",
+        "energy_J": "Consumo de Energia (Joules)",
+    }
+
+    # As médias não dependem da métrica: um único groupby serve a todos os gráficos
+    grouped = comparison_df.groupby(["display_mode", "N"]).mean(numeric_only=True).reset_index()
+    orders = level_orders(grouped, "display_mode", "display_mode")
+    fig, ax = plt.subplots(figsize=(14, 8))
+
+    for metric, title in metrics_to_plot.items():
+        if metric not in grouped.columns or grouped[metric].isnull().all():
+            continue
+
+        ax.clear()
+        sns.lineplot(
+            data=grouped,
+            x="N",
+            y=metric,
+            hue="display_mode",
+            style="display_mode",
+            **orders,
+            markers=True,
+            dashes=False,
+            legend="full",
+            palette="viridis",
+            linewidth=2.5,
+            markersize=8,
+            ax=ax,
+        )
+
+        ax.set_title(f"Melhor/Pior em Bloco vs. Matriz Inteira: {title}", fontsize=20, weight="bold")
+        ax.set_ylabel(title, fontsize=14)
+        ax.set_xlabel("Tamanho da Matriz (N)", fontsize=14)
+        ax.legend(title="Estratégia", fontsize=12)
+        ax.set_xscale("log", base=2)
+        ax.grid(True, which="both", ls="--")
+
+        out_path = plot_dir / f"best_vs_whole_{metric}.png"
+        fig.tight_layout()
+        print(f"Salvando gráfico de comparação em {out_path}")
+        save_png(fig, out_path)
+
+    plt.close(fig)
+
+
+def render_bybs(df: pd.DataFrame, plot_dir: Path):
+    plot_by_bs_and_metric(df, plot_dir)
+    plot_best_vs_whole(df, plot_dir)
+
+
+# --- Command Line Entry Points ---
+
+
+def _main_individual():
+    parser = argparse.ArgumentParser(
+        description="Generate comparative plots from benchmark results."
+    )
+    parser.add_argument(
+        "--results-dir",
+        "-r",
+        type=Path,
+        default=Path("results"),
+        help="Path to the results directory containing runs.csv and log files.",
+    )
+    parser.add_argument(
+        "--filter",
+        nargs="+",
+        help="A list of modes to include in the plots (e.g., avx scalar blas_whole).",
+    )
+    args = parser.parse_args()
+
+    if not args.results_dir.exists():
+        print(f"Error: Results directory '{args.results_dir}' not found.")
+        return
+
+    try:
+        df_analyzed = load_metrics(args.results_dir)
+
+        if args.filter:
+            print(f"Filtering results to include only: {', '.join(args.filter)}")
+            df_analyzed = df_analyzed[df_analyzed["mode"].isin(args.filter)]
+
+        plot_dir = args.results_dir / "plots"
+        plot_dir.mkdir(exist_ok=True)
+
+        render_individual(df_analyzed, plot_dir)
+        wait_for_png_writes()
+
+        print(
+            "\nPlotting complete! 🎨 Check the 'results/plots/' directory for your graphs."
+        )
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+
+
+def _main_grid():
+    parser = argparse.ArgumentParser(description="Generate comparative plots from benchmark results.")
+    parser.add_argument("--results-dir", "-r", type=Path, default=Path("results"),
+                        help="Path to the results directory containing runs.csv and log files.")
+    args = parser.parse_args()
+
+    if not args.results_dir.exists():
+        print(f"Error: Results directory '{args.results_dir}' not found.")
+        return
+
+    try:
+        df_analyzed = load_metrics(args.results_dir)
+
+        plot_dir = args.results_dir / "plots"
+        plot_dir.mkdir(exist_ok=True)
+
+        render_grid(df_analyzed, plot_dir)
+        wait_for_png_writes()
+
+        print("\nPlotting complete! 🎨 Check the 'results/plots/' directory.")
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+
+
+def _main_bybs():
+    parser = argparse.ArgumentParser(
+        description="Gera gráficos comparativos de alta qualidade a partir de resultados de benchmark."
+    )
+    parser.add_argument(
+        "--results-dir",
+        "-r",
+        type=Path,
+        default=Path("results"),
+        help="Caminho para o diretório de resultados com runs.csv e arquivos de log.",
+    )
+    parser.add_argument(
+        "--output-dir",
+        "-o",
+        type=Path,
+        help="Caminho para o diretório de saída dos gráficos. Padrão: [results-dir]/plots.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        help="Uma lista de tamanhos de matriz (N) para incluir nos gráficos.",
+    )
+    parser.add_argument(
+        "--rename",
+        nargs="+",
+        help="Renomeia estratégias na legenda. Formato: 'nome_antigo:Novo Nome'",
+    )
+    parser.add_argument(
+        "--filter",
+        nargs="+",
+        help="Uma lista de modos para incluir nos gráficos (ex: avx scalar blas).",
+    )
+    parser.add_argument(
+        "--blacklist",
+        nargs="+",
+        help="Uma lista de modos para excluir dos gráficos.",
+    )
+    args = parser.parse_args()
+
+    try:
+        if not args.results_dir.exists():
+            print(f"Erro: Diretório de resultados '{args.results_dir}' não encontrado.")
+            return
+
+        rename_map = {}
+        if args.rename:
+            for item in args.rename:
+                if ":" not in item:
+                    print(f"Aviso: Formato inválido para --rename '{item}'. Use 'antigo:novo'.")
+                    continue
+                old, new = item.split(":", 1)
+                rename_map[old] = new.strip("\"'")
+
+        df_analyzed = load_metrics(
+            args.results_dir, rename_map, "Aviso: Arquivo de log não encontrado em {}"
+        )
+
+        if args.sizes:
+            print(f"Filtrando resultados para incluir apenas os tamanhos: {', '.join(map(str, args.sizes))}")
+            df_analyzed = df_analyzed[df_analyzed["N"].isin(args.sizes)]
+
+        if args.filter:
+            print(f"Filtrando resultados para incluir apenas os modos: {', '.join(args.filter)}")
+            df_analyzed = df_analyzed[df_analyzed["mode_orig"].isin(args.filter)]
+
+        if args.blacklist:
+            print(f"Excluindo modos da lista negra: {', '.join(args.blacklist)}")
+            df_analyzed = df_analyzed[~df_analyzed["display_mode"].isin(args.blacklist)]
+
+        if args.output_dir:
+            plot_dir = args.output_dir
+        else:
+            plot_dir = args.results_dir / "plots"
+        plot_dir.mkdir(exist_ok=True, parents=True)
+
+        render_bybs(df_analyzed, plot_dir)
+        wait_for_png_writes()
+
+        print(
+            f"\nPlotagem completa! 🎨 Seus novos gráficos estão no diretório '{plot_dir}'."
+        )
+
+    except FileNotFoundError as e:
+        print(f"Erro: {e}")
+    except Exception as e:
+        print(f"Um erro inesperado ocorreu: {e}")
+
+
+STYLES = {
+    "individual": _main_individual,
+    "grid": _main_grid,
+    "bybs": _main_bybs,
+}
+
+
+def main(style: str):
+    """Runs the command line of one plot style: 'individual', 'grid' or 'bybs'."""
+    STYLES[style]()
+
+
+def run_all():
+    """Loads the results once and renders every plot style in the same process."""
+    parser = argparse.ArgumentParser(
+        description="Generate every plot style from benchmark results in one run."
+    )
+    parser.add_argument(
+        "--results-dir",
+        "-r",
+        type=Path,
+        default=Path("results"),
+        help="Path to the results directory containing runs.csv and log files.",
+    )
+    args = parser.parse_args()
+
+    if not args.results_dir.exists():
+        print(f"Error: Results directory '{args.results_dir}' not found.")
+        return
+
+    try:
+        df_analyzed = load_metrics(args.results_dir)
+
+        plot_dir = args.results_dir / "plots"
+        plot_dir.mkdir(exist_ok=True)
+
+        render_individual(df_analyzed, plot_dir)
+        render_grid(df_analyzed, plot_dir)
+        render_bybs(df_analyzed, plot_dir)
+        wait_for_png_writes()
+
+        print(f"\nPlotting complete! 🎨 Check the '{plot_dir}' directory for your graphs.")
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+
+
+if __name__ == "__main__":
+    run_all()